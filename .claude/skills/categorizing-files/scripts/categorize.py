@@ -20,12 +20,21 @@ Directory Exclusion Layers:
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import json
+import os
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Literal
 
+try:
+    import ahocorasick  # optional: pyahocorasick speeds up Phase 4
+except ImportError:
+    ahocorasick = None
+
 Category = Literal["Config", "Tests", "Docs", "Scripts", "Source Code", "Data", "AI Tooling", "Other"]
 Confidence = Literal["High", "Medium", "Low"]
 
@@ -62,6 +71,7 @@ EXTENDED_EXCLUDE_DIRS = {
     # Eggs and wheels
     "*.egg-info", ".eggs",
 }
+_EXTENDED_EXCLUDE_GLOBS = tuple(p for p in EXTENDED_EXCLUDE_DIRS if "*" in p)
 
 # Directories to ALLOW even if they start with "."
 ALLOWED_DOT_DIRS = {".claude", ".cursor", ".aider", ".github", ".vscode"}
@@ -94,6 +104,23 @@ class ExclusionStats:
         return f"Excluded {self.total()} directories: " + ", ".join(parts)
 
 
+@cache
+def _load_pathspec():
+    """Import pathspec on first use (optional; enables Layer 2). It is slow to import."""
+    try:
+        import pathspec
+    except ImportError:
+        return None
+    return pathspec
+
+
+@cache
+def _compile_gitignore(path: str, mtime_ns: int) -> object:
+    # Keyed on mtime so repeated scans reuse the spec until the file changes
+    with open(path) as f:
+        return _load_pathspec().PathSpec.from_lines("gitwildmatch", f)
+
+
 def load_gitignore_spec(root: Path) -> tuple[object | None, bool]:
     """
     Try to load .gitignore as a pathspec.
@@ -105,9 +132,8 @@ def load_gitignore_spec(root: Path) -> tuple[object | None, bool]:
     if not gitignore_path.exists():
         return None, False
 
-    try:
-        import pathspec
-    except ImportError:
+    pathspec = _load_pathspec()
+    if pathspec is None:
         print(
             "Warning: Could not parse .gitignore (pathspec library not installed). "
             "Using default exclusions.",
@@ -116,8 +142,7 @@ def load_gitignore_spec(root: Path) -> tuple[object | None, bool]:
         return None, False
 
     try:
-        with open(gitignore_path) as f:
-            spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
+        spec = _compile_gitignore(str(gitignore_path.resolve()), gitignore_path.stat().st_mtime_ns)
         return spec, True
     except Exception as e:
         print(f"Warning: Could not parse .gitignore ({e}). Using default exclusions.", file=sys.stderr)
@@ -177,61 +202,64 @@ def should_exclude_dir(
         return True
 
     # Also check for pattern matches like *.egg-info
-    for pattern in EXTENDED_EXCLUDE_DIRS:
-        if "*" in pattern:
-            import fnmatch
-            if fnmatch.fnmatch(dir_name, pattern):
-                stats.layer3_defaults += 1
-                stats.excluded_dirs.add(str(rel_path))
-                return True
+    for pattern in _EXTENDED_EXCLUDE_GLOBS:
+        if fnmatch.fnmatch(dir_name, pattern):
+            stats.layer3_defaults += 1
+            stats.excluded_dirs.add(str(rel_path))
+            return True
 
     return False
 
 
 def is_hidden_dir(dir_name: str, exclude_hidden: bool) -> bool:
     """Check if directory is hidden and should be excluded."""
-    if not exclude_hidden:
+    if not dir_name.startswith(".") or not exclude_hidden:
         return False
-    if dir_name.startswith(".") and dir_name not in ALLOWED_DOT_DIRS:
-        return True
-    return False
+    return dir_name not in ALLOWED_DOT_DIRS
 
 
 # =============================================================================
 # PHASE 1: Directory and Filename Patterns
 # =============================================================================
 
-DIR_PATTERNS: dict[str, Category] = {
-    r"(^|/)tests?(/|$)": "Tests",
-    r"(^|/)__tests__(/|$)": "Tests",
-    r"(^|/)spec(/|$)": "Tests",
-    r"(^|/)e2e(/|$)": "Tests",
-    r"(^|/)docs?(/|$)": "Docs",
-    r"(^|/)documentation(/|$)": "Docs",
-    r"(^|/)references?(/|$)": "Docs",
-    r"(^|/)\.github(/|$)": "Docs",
-    r"(^|/)scripts?(/|$)": "Scripts",
-    r"(^|/)bin(/|$)": "Scripts",
-    r"(^|/)tools(/|$)": "Scripts",
-    r"(^|/)src(/|$)": "Source Code",
-    r"(^|/)lib(/|$)": "Source Code",
-    r"(^|/)pkg(/|$)": "Source Code",
-    r"(^|/)app(/|$)": "Source Code",
-    r"(^|/)core(/|$)": "Source Code",
-    r"(^|/)backend(/|$)": "Source Code",
-    r"(^|/)frontend(/|$)": "Source Code",
-    r"(^|/)data(/|$)": "Data",
-    r"(^|/)datasets?(/|$)": "Data",
-    r"(^|/)fixtures(/|$)": "Data",
-    r"(^|/)samples?(/|$)": "Data",
-    r"(^|/)\.claude(/|$)": "AI Tooling",
-    r"(^|/)\.cursor(/|$)": "AI Tooling",
-    r"(^|/)\.aider(/|$)": "AI Tooling",
-    r"(^|/)prompts?(/|$)": "AI Tooling",
-    r"(^|/)config(/|$)": "Config",
-    r"(^|/)conf(/|$)": "Config",
-    r"(^|/)\.config(/|$)": "Config",
-    r"(^|/)\.vscode(/|$)": "Config",
+# Directory names, matched case-insensitively against each component of the
+# parent path. When several components match, the entry listed first wins.
+DIR_NAMES: dict[str, Category] = {
+    "test": "Tests", "tests": "Tests",
+    "__tests__": "Tests",
+    "spec": "Tests",
+    "e2e": "Tests",
+    "doc": "Docs", "docs": "Docs",
+    "documentation": "Docs",
+    "reference": "Docs", "references": "Docs",
+    ".github": "Docs",
+    "script": "Scripts", "scripts": "Scripts",
+    "bin": "Scripts",
+    "tools": "Scripts",
+    "src": "Source Code",
+    "lib": "Source Code",
+    "pkg": "Source Code",
+    "app": "Source Code",
+    "core": "Source Code",
+    "backend": "Source Code",
+    "frontend": "Source Code",
+    "data": "Data",
+    "dataset": "Data", "datasets": "Data",
+    "fixtures": "Data",
+    "sample": "Data", "samples": "Data",
+    ".claude": "AI Tooling",
+    ".cursor": "AI Tooling",
+    ".aider": "AI Tooling",
+    "prompt": "AI Tooling", "prompts": "AI Tooling",
+    "config": "Config",
+    "conf": "Config",
+    ".config": "Config",
+    ".vscode": "Config",
+}
+
+# Multi-component patterns that a single name lookup can't express;
+# checked only when no entry in DIR_NAMES matched.
+DIR_PATH_PATTERNS: dict[str, Category] = {
     r"(^|/)\.github/workflows(/|$)": "Config",
 }
 
@@ -302,6 +330,48 @@ SCHEMA_PATTERNS = [
     r".*\.proto$",
 ]
 
+# Characters re.IGNORECASE folds onto ASCII letters that str.lower() leaves alone
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})  # İ ı ſ
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text so case-sensitive matching agrees with re.IGNORECASE."""
+    if not text.isascii():
+        text = text.translate(_CASE_FOLD)
+    return text.lower()
+
+
+# Compiled once at import so per-file matching never goes through re's cache.
+# Patterns are lowercase and run against fold_case() text instead of using
+# re.IGNORECASE, which folds case on every match attempt.
+_DIR_NAME_RANKS = {name: (rank, c) for rank, (name, c) in enumerate(DIR_NAMES.items())}
+_DIR_PATH_PATTERNS = tuple((re.compile(p), c) for p, c in DIR_PATH_PATTERNS.items())
+
+_SUFFIX_CATEGORY: dict[str, Category] = {
+    **dict.fromkeys(DATA_EXTENSIONS, "Data"),
+    **dict.fromkeys(SOURCE_EXTENSIONS, "Source Code"),
+    **dict.fromkeys(SCRIPT_EXTENSIONS, "Scripts"),
+}
+
+
+def _union(groups: dict[str, list[str]]) -> re.Pattern:
+    """
+    Fuse pattern lists into one alternation with a named group per list.
+
+    match.lastgroup names the earliest listed group that matched, so a
+    single match call stands in for trying each list in order.
+    """
+    alternatives = ("|".join(f"(?:{p})" for p in patterns) for patterns in groups.values())
+    return re.compile("|".join(f"(?P<{key}>{alt})" for key, alt in zip(groups, alternatives)))
+
+
+_NAME_RE = _union({
+    "ai": AI_PATTERNS,
+    "schema": SCHEMA_PATTERNS,
+    "test": TEST_PATTERNS,
+    "config": CONFIG_PATTERNS,
+})
+
 # =============================================================================
 # PHASE 2: Frontmatter Indicators
 # =============================================================================
@@ -314,20 +384,19 @@ def extract_yaml_frontmatter(content: str) -> dict[str, str] | None:
     """Extract YAML frontmatter from content if present."""
     if not content.startswith("---"):
         return None
-    lines = content.split("\n")
-    end_idx = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = i
-            break
-    if end_idx is None:
-        return None
+    # Walk line by line so only the frontmatter is scanned, not the whole body
     frontmatter = {}
-    for line in lines[1:end_idx]:
+    start = content.find("\n") + 1
+    while start:
+        end = content.find("\n", start)
+        line = content[start:] if end == -1 else content[start:end]
+        if line.strip() == "---":
+            return frontmatter
         if ":" in line:
-            key = line.split(":")[0].strip().lower()
-            frontmatter[key] = line.split(":", 1)[1].strip() if ":" in line else ""
-    return frontmatter
+            key, _, value = line.partition(":")
+            frontmatter[key.strip().lower()] = value.strip()
+        start = end + 1
+    return None
 
 
 def analyze_frontmatter(content: str) -> Category | None:
@@ -387,30 +456,152 @@ AI_SIGNALS = [
     r"\bagent\b", r"\bskill\b",
 ]
 
+_REGEX_META = frozenset(".^$*+?{}[]()|\\")
+_ESCAPED_CHARS = {"t": "\t", "n": "\n", "r": "\r", "f": "\f", "v": "\v"}
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Return the longest substring every match of pattern must contain ("" if none is known).
+
+    Scans the top-level sequence of atoms, collecting runs of plain
+    characters; classes, anchors and optional atoms end a run. A group,
+    alternation or unrecognized escape stops the scan, so the answer can
+    only be shorter than necessary, never wrong.
+    """
+    if "|" in pattern:
+        return ""
+    best = ""
+    run: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "\\" and i + 1 < n:
+            nxt = pattern[i + 1]
+            if not nxt.isalnum():
+                char = nxt
+            elif nxt in _ESCAPED_CHARS:
+                char = _ESCAPED_CHARS[nxt]
+            elif nxt in "sSwWdDbBAZ":
+                char = None
+            else:
+                break
+            i += 2
+        elif c == "[":
+            j = i + 1
+            if pattern.startswith("^", j):
+                j += 1
+            if pattern.startswith("]", j):
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            if j >= n:
+                break
+            char = None
+            i = j + 1
+        elif c in "^$.":
+            char = None
+            i += 1
+        elif c in _REGEX_META:
+            break
+        else:
+            char = c
+            i += 1
+
+        # A quantified atom contributes its minimum repeat, then ends the run
+        if i < n and pattern[i] in "?*+{":
+            if pattern[i] == "{":
+                m = re.match(r"\{(\d*)(?:,\d*)?\}", pattern[i:])
+                if m is None:
+                    if char is not None:
+                        run.append(char)
+                    break
+                minimum = int(m.group(1) or 0)
+                i += m.end()
+            else:
+                minimum = 1 if pattern[i] == "+" else 0
+                i += 1
+            if i < n and pattern[i] in "?+":
+                i += 1  # lazy or possessive
+            if char is not None:
+                run.append(char * minimum)
+            char = None
+
+        if char is None:
+            best = max(best, "".join(run), key=len)
+            run = []
+        else:
+            run.append(char)
+    return max(best, "".join(run), key=len)
+
+
+def _compile_signals(patterns: list[str]) -> tuple[tuple[str, re.Pattern[str] | None], ...]:
+    """
+    Compile a signal family for matching against fold_case() text.
+
+    Patterns are lowercased and compiled without re.IGNORECASE, and each is
+    paired with a literal that is checked with ``in`` before the regex runs.
+    Both matter: IGNORECASE and a leading ``\\b`` each disable the regex
+    engine's fast literal scan, costing ~100us per pattern on a 5KB sample.
+    Patterns that are nothing but that literal get no regex at all.
+    """
+    compiled = []
+    for p in patterns:
+        if re.search(r"\\[A-Z]", p):
+            raise ValueError(f"signal pattern cannot be lowercased safely: {p!r}")
+        p = p.lower()
+        literal = _required_literal(p)
+        compiled.append((literal, None if re.escape(literal) == p else re.compile(p, re.MULTILINE)))
+    return tuple(compiled)
+
+
+# Distinct signals a family needs before Phase 3 assigns its category
+MIN_SIGNALS = 2
+
+_TEST_SIGNALS_RE = _compile_signals(TEST_SIGNALS)
+_SCRIPT_SIGNALS_RE = _compile_signals(SCRIPT_SIGNALS)
+_SOURCE_SIGNALS_RE = _compile_signals(SOURCE_SIGNALS)
+_DOCS_SIGNALS_RE = _compile_signals(DOCS_SIGNALS)
+_DATA_SIGNALS_RE = _compile_signals(DATA_SIGNALS)
+_AI_SIGNALS_RE = _compile_signals(AI_SIGNALS)
+
+
+def count_signals(
+    signals: tuple[tuple[str, re.Pattern[str] | None], ...],
+    text: str,
+    cap: int = MIN_SIGNALS,
+) -> int:
+    """
+    Count how many signal patterns occur in fold_case() text.
+
+    Stops as soon as cap is reached: callers only compare against
+    MIN_SIGNALS, so the remaining patterns can't change the outcome.
+    """
+    count = 0
+    for literal, pat in signals:
+        if literal in text and (pat is None or pat.search(text)):
+            count += 1
+            if count >= cap:
+                break
+    return count
+
 
 def analyze_content_structure(content: str) -> Category | None:
     """Phase 3: Analyze content structure for category signals."""
-    lines = content[:5000]  # Sample first 5KB
-
-    def has_signals(signals: list[str]) -> int:
-        count = 0
-        for pattern in signals:
-            if re.search(pattern, lines, re.MULTILINE | re.IGNORECASE):
-                count += 1
-        return count
+    lines = fold_case(content[:5000])  # Sample first 5KB
 
     # Check each category (order matters for priority)
-    if has_signals(TEST_SIGNALS) >= 2:
+    if count_signals(_TEST_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "Tests"
-    if has_signals(SCRIPT_SIGNALS) >= 2:
+    if count_signals(_SCRIPT_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "Scripts"
-    if has_signals(AI_SIGNALS) >= 2:
+    if count_signals(_AI_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "AI Tooling"
-    if has_signals(SOURCE_SIGNALS) >= 2:
+    if count_signals(_SOURCE_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "Source Code"
-    if has_signals(DOCS_SIGNALS) >= 2:
+    if count_signals(_DOCS_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "Docs"
-    if has_signals(DATA_SIGNALS) >= 2:
+    if count_signals(_DATA_SIGNALS_RE, lines) >= MIN_SIGNALS:
         return "Data"
 
     return None
@@ -431,14 +622,43 @@ CATEGORY_KEYWORDS: dict[Category, list[str]] = {
 }
 
 
+_CATEGORY_KEYWORDS_LOWER = {
+    category: [kw.lower() for kw in keywords] for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+
+def _build_keyword_automaton() -> object | None:
+    """Build one Aho-Corasick automaton over every category keyword (lowercased)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for category, keywords in _CATEGORY_KEYWORDS_LOWER.items():
+        for kw in keywords:
+            _, categories = automaton.get(kw, (kw, ()))
+            automaton.add_word(kw, (kw, categories + (category,)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AC = _build_keyword_automaton()
+
+
 def detect_by_keywords(content: str) -> Category | None:
     """Phase 4: Detect category by keyword frequency."""
     content_lower = content[:10000].lower()
     scores: dict[Category, int] = {}
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw.lower() in content_lower)
-        if score >= 2:
-            scores[category] = score
+    if _KEYWORD_AC is not None:
+        # Single pass over the text; score = distinct keywords seen per category
+        hits: dict[Category, int] = dict.fromkeys(CATEGORY_KEYWORDS, 0)
+        for _, categories in {value for _, value in _KEYWORD_AC.iter(content_lower)}:
+            for category in categories:
+                hits[category] += 1
+        scores = {category: score for category, score in hits.items() if score >= 2}
+    else:
+        for category, keywords in _CATEGORY_KEYWORDS_LOWER.items():
+            score = sum(1 for kw in keywords if kw in content_lower)
+            if score >= 2:
+                scores[category] = score
     if scores:
         return max(scores, key=lambda k: scores[k])
     return None
@@ -448,65 +668,83 @@ def detect_by_keywords(content: str) -> Category | None:
 # Main Categorization Functions
 # =============================================================================
 
-def categorize_by_path(filepath: Path) -> Category | None:
-    """Phase 1: Categorize based on path and filename patterns only."""
-    name = filepath.name
-    suffix = filepath.suffix.lower()
-    dir_path = str(filepath.parent)
-
-    # Directory patterns
-    for pattern, category in DIR_PATTERNS.items():
-        if re.search(pattern, dir_path, re.IGNORECASE):
+@cache
+def _dir_category(dir_path: str) -> Category | None:
+    """Directory rules for one parent path; cached so sibling files share one lookup."""
+    best = None
+    for part in Path(dir_path).parts:
+        hit = _DIR_NAME_RANKS.get(fold_case(part))
+        if hit is not None and (best is None or hit < best):
+            best = hit
+    if best is not None:
+        return best[1]
+    dir_path_lc = fold_case(dir_path)
+    for rx, category in _DIR_PATH_PATTERNS:
+        if rx.search(dir_path_lc):
             return category
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _name_category(name: str, at_root: bool) -> Category | None:
+    """Filename and extension rules; cached because names repeat across directories."""
+    name_lc = fold_case(name)
+    # Same split as Path.suffix/Path.stem, without re-deriving the name
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        stem, suffix = name[:dot], name[dot:].lower()
+    else:
+        stem, suffix = name, ""
 
     # AI tooling files
     if name in AI_FILES:
         return "AI Tooling"
-    for pattern in AI_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return "AI Tooling"
+    match = _NAME_RE.match(name_lc)
+    kind = match.lastgroup if match else None
+    if kind == "ai":
+        return "AI Tooling"
 
     # Schema/specification files → Docs
-    if name in SCHEMA_FILES:
+    if name in SCHEMA_FILES or kind == "schema":
         return "Docs"
-    for pattern in SCHEMA_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return "Docs"
 
     # Test files
-    for pattern in TEST_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return "Tests"
+    if kind == "test":
+        return "Tests"
 
     # Config files
-    if name in CONFIG_FILES:
+    if name in CONFIG_FILES or kind == "config":
         return "Config"
-    for pattern in CONFIG_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return "Config"
 
     # Doc files
-    stem = filepath.stem.upper()
-    if stem in DOC_FILES or name.upper().startswith("README"):
+    # upper(), not name_lc: ligatures such as "ﬆ" only expand when uppercased
+    if stem.upper() in DOC_FILES or name_lc.startswith("readme"):
         return "Docs"
 
-    # Script extensions
-    if suffix in SCRIPT_EXTENSIONS:
-        return "Scripts"
+    # Script, source code, and data extensions
+    category = _SUFFIX_CATEGORY.get(suffix)
+    if category == "Data" and at_root and suffix in {".json", ".yaml", ".yml"}:
+        return "Config"
+    return category
 
-    # Source code extensions
-    if suffix in SOURCE_EXTENSIONS:
-        return "Source Code"
 
-    # Data extensions
-    if suffix in DATA_EXTENSIONS:
-        if dir_path and dir_path != ".":
-            return "Data"
-        if suffix in {".json", ".yaml", ".yml"}:
-            return "Config"
-        return "Data"
+def categorize_by_path(filepath: Path) -> Category | None:
+    """Phase 1: Categorize based on path and filename patterns only."""
+    # Same as str(filepath.parent), without building a parent Path
+    dir_path = os.path.dirname(str(filepath)) or "."
+    return _dir_category(dir_path) or _name_category(filepath.name, dir_path == ".")
 
-    return None
+
+def read_prefix(path: Path, n: int = 16384) -> str:
+    """
+    Read at most the first n characters of a file.
+
+    Phases 2-4 only inspect the start of a file (frontmatter, then 5KB and
+    10KB samples), so large data files are never read in full. Text mode
+    keeps the newline translation and decoding behaviour of read_text().
+    """
+    with open(path, errors="ignore") as f:
+        return f.read(n)
 
 
 def categorize_file(
@@ -533,9 +771,14 @@ def categorize_file(
     if not analyze_content:
         return "Other", "Low"
 
+    return analyze_file_content(path)
+
+
+def analyze_file_content(path: str | Path) -> tuple[Category, Confidence]:
+    """Phases 2-4: categorize a file that Phase 1 could not place, from its content."""
     # Read content for Phases 2-4
     try:
-        content = path.read_text(errors="ignore")
+        content = read_prefix(path)
     except (OSError, IOError):
         return "Other", "Low"
 
@@ -557,12 +800,155 @@ def categorize_file(
     return "Other", "Low"
 
 
+def _analyze_one(path: str) -> tuple[str, Category, Confidence]:
+    # Module-level so process pool workers can run it
+    category, confidence = analyze_file_content(path)
+    return path, category, confidence
+
+
+# Below this many files, process pool startup outweighs the content analysis it spreads out
+PARALLEL_MIN_FILES = 256
+
+
+def _analyze_many(paths: list[str], jobs: int | None) -> list[tuple[str, Category, Confidence]]:
+    if jobs != 1 and len(paths) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor  # deferred: slow import
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(_analyze_one, paths, chunksize=64))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No working multiprocessing, or a worker died; redo serially
+    return [_analyze_one(p) for p in paths]
+
+
+def categorize_many(
+    paths: list[str],
+    analyze_content: bool = False,
+    jobs: int | None = None,
+    cache: dict[str, list] | None = None,
+) -> list[tuple[str, Category, Confidence]]:
+    """
+    Categorize many files, using a process pool for large content-analysis runs.
+
+    Phase 1 runs inline; only files it cannot place are read, and only
+    those are sent to worker processes or looked up in the cache.
+
+    Args:
+        paths: Files to categorize
+        analyze_content: Enable content analysis (Phases 2-4)
+        jobs: Worker processes (None = CPU count, 1 = always serial)
+        cache: Results from load_cache(); consulted and updated in place
+            when analyze_content is set
+
+    Returns:
+        List of (path, category, confidence) in input order
+    """
+    done: dict[str, tuple[str, Category, Confidence]] = {}
+    todo: list[str] = []
+    for p in paths:
+        category = categorize_by_path(Path(p))
+        if category:
+            done[p] = (p, category, "High")
+        elif analyze_content:
+            todo.append(p)
+        else:
+            done[p] = (p, "Other", "Low")
+
+    if cache is None:
+        for result in _analyze_many(todo, jobs):
+            done[result[0]] = result
+        return [done[p] for p in paths]
+
+    stamps: dict[str, list[int]] = {}
+    stale: list[str] = []
+    for p in todo:
+        try:
+            st = os.stat(p)
+        except OSError:
+            stale.append(p)
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(p)
+        if entry and entry[:2] == stamp:
+            done[p] = (p, entry[2], entry[3])
+        else:
+            stamps[p] = stamp
+            stale.append(p)
+
+    for p, category, confidence in _analyze_many(stale, jobs):
+        done[p] = (p, category, confidence)
+        if p in stamps:
+            cache[p] = stamps[p] + [category, confidence]
+    return [done[p] for p in paths]
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+def _default_cache_path() -> Path | None:
+    """$XDG_CACHE_HOME/promptkit/categorize.json, or None if no cache dir is known."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None  # No HOME and no passwd entry (some containers)
+    return Path(base) / "promptkit" / "categorize.json"
+
+
+def _cache_version() -> str:
+    # Any edit to this script (patterns, phases) invalidates cached results
+    return f"1:{Path(__file__).stat().st_mtime_ns}"
+
+
+def load_cache(path: Path | None = None) -> dict[str, list]:
+    """
+    Load cached content-analysis results (path defaults to the user cache dir).
+
+    Returns:
+        {abspath: [mtime_ns, size, category, confidence]}; empty if the cache
+        is missing, unreadable, or was written by a different script version
+    """
+    if path is None:
+        path = _default_cache_path()
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _cache_version():
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(cache: dict[str, list], path: Path | None = None) -> None:
+    """Write cached results atomically; failures only produce a warning."""
+    if path is None:
+        path = _default_cache_path()
+    if path is None:
+        print("Warning: Could not write cache (no cache directory; set XDG_CACHE_HOME)", file=sys.stderr)
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"version": _cache_version(), "files": cache}, separators=(",", ":")))
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"Warning: Could not write cache ({e})", file=sys.stderr)
+
+
 def categorize_directory(
     root: str | Path,
     analyze_content: bool = False,
     exclude_hidden: bool = True,
     include_ignored: bool = False,
     include_all: bool = False,
+    jobs: int | None = None,
+    cache: dict[str, list] | None = None,
 ) -> tuple[dict[Category, list[tuple[Path, Confidence]]], ExclusionStats]:
     """
     Categorize all files in a directory tree with layered exclusion.
@@ -573,6 +959,8 @@ def categorize_directory(
         exclude_hidden: Skip hidden directories (except allowed ones)
         include_ignored: Bypass .gitignore and default exclusions (Layer 2-3)
         include_all: Bypass ALL exclusions including always-exclude (use with caution)
+        jobs: Worker processes for content analysis (None = CPU count, 1 = serial)
+        cache: Content-analysis results from load_cache(), updated in place
 
     Returns:
         Tuple of (results dict, exclusion stats)
@@ -593,50 +981,56 @@ def categorize_directory(
     # Load .gitignore if available
     gitignore_spec, use_gitignore = load_gitignore_spec(root)
 
-    # Track excluded directories to skip their contents
-    excluded_prefixes: set[Path] = set()
-
-    for item in sorted(root.rglob("*")):
-        rel_path = item.relative_to(root)
+    files: list[Path] = []
+    paths: list[str] = []
+
+    # Iterative scandir walk; excluded directories are never pushed, so their
+    # contents are never listed. DirEntry caches the file type from readdir.
+    stack: list[tuple[str, Path]] = [(str(root), Path())]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
 
-        # Check if we're inside an already-excluded directory
-        skip = False
-        for prefix in excluded_prefixes:
+        for entry in entries:
             try:
-                rel_path.relative_to(prefix)
-                skip = True
-                break
-            except ValueError:
-                pass
-        if skip:
-            continue
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                # Skip broken symlinks, sockets, FIFOs
+                try:
+                    if entry.is_file():
+                        files.append(rel_dir / entry.name)
+                        paths.append(entry.path)
+                except OSError:
+                    pass
+                continue
 
-        # Handle directories
-        if item.is_dir():
-            dir_name = item.name
+            rel_path = rel_dir / entry.name
 
             # Check hidden directories
-            if is_hidden_dir(dir_name, exclude_hidden):
+            if is_hidden_dir(entry.name, exclude_hidden):
                 stats.hidden_dirs += 1
                 stats.excluded_dirs.add(str(rel_path))
-                excluded_prefixes.add(rel_path)
                 continue
 
             # Check exclusion layers
             if should_exclude_dir(
-                item, rel_path, gitignore_spec, use_gitignore,
+                Path(entry.path), rel_path, gitignore_spec, use_gitignore,
                 include_ignored, include_all, stats
             ):
-                excluded_prefixes.add(rel_path)
                 continue
 
-            continue  # Don't categorize directories
-
-        # Handle files
-        if not item.is_file():
-            continue
+            # Like os.walk, list symlinked directories but don't follow them
+            if not entry.is_symlink():
+                stack.append((entry.path, rel_path))
 
-        category, confidence = categorize_file(item, analyze_content=analyze_content)
+    for rel_path, (_, category, confidence) in zip(files, categorize_many(paths, analyze_content, jobs, cache)):
         results[category].append((rel_path, confidence))
 
     # Sort each category
@@ -654,17 +1048,26 @@ def print_summary(
     for category, files in results.items():
         if not files:
             continue
-        print(f"\n{category} ({len(files)}):")
-        for path, confidence in files:
-            if confidence == "High":
-                print(f"  - {path}")
-            else:
-                print(f"  - {path} ({confidence})")
+        # One write per category instead of one print() per file
+        lines = [f"\n{category} ({len(files)}):"]
+        lines += [f"  - {path}" if confidence == "High" else f"  - {path} ({confidence})" for path, confidence in files]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if stats and stats.total() > 0:
         print(f"\n{stats.summary()}")
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for --jobs: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Categorize project files into Config, Tests, Docs, Scripts, Source Code, Data, AI Tooling, Other.",
@@ -705,6 +1108,17 @@ Use --include-all to bypass ALL layers (use with extreme caution).
         action="store_true",
         help="Include hidden directories (those starting with .)",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for --analyze-content on large trees (default: CPU count; 1 = serial)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse --analyze-content results for unchanged files across runs",
+    )
     args = parser.parse_args()
 
     target = Path(args.path)
@@ -713,13 +1127,18 @@ Use --include-all to bypass ALL layers (use with extreme caution).
         category, confidence = categorize_file(target, analyze_content=args.analyze_content)
         print(f"{target}: {category} ({confidence})")
     else:
+        cache = load_cache() if args.cache and args.analyze_content else None
         results, stats = categorize_directory(
             target,
             analyze_content=args.analyze_content,
             exclude_hidden=not args.no_exclude_hidden,
             include_ignored=args.include_ignored,
             include_all=args.include_all,
+            jobs=args.jobs,
+            cache=cache,
         )
+        if cache is not None:
+            save_cache(cache)
         print_summary(results, stats)
 
 
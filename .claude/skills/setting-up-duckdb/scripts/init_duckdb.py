@@ -11,15 +11,12 @@ Automatically updates .gitignore to protect sensitive database files.
 """
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     import duckdb
-except ImportError:
-    print("Error: duckdb not installed. Run: pip install duckdb")
-    sys.exit(1)
 
 
 COMMON_EXTENSIONS = [
@@ -33,6 +30,16 @@ DEFAULT_CONFIG = {
     "enable_object_cache": "true",
 }
 
+SUMMARY_QUERY = """
+SELECT 'setting' AS kind, name, value
+FROM duckdb_settings()
+WHERE name IN ('memory_limit', 'threads', 'temp_directory')
+UNION ALL
+SELECT 'extension' AS kind, extension_name, NULL
+FROM duckdb_extensions()
+WHERE loaded = true
+"""
+
 DUCKDB_GITIGNORE_ENTRIES = [
     "# DuckDB",
     "*.duckdb",
@@ -41,19 +48,43 @@ DUCKDB_GITIGNORE_ENTRIES = [
 ]
 
 
-def find_git_root(start_path: Path) -> Path | None:
-    """Find the root of the git repository containing start_path."""
+def require_duckdb():
+    """
+    Import duckdb on first use, exiting with install instructions if missing.
+
+    Deferred so that --help, the overwrite prompt and the .gitignore helpers
+    don't pay for loading the DuckDB extension module.
+    """
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            cwd=start_path if start_path.is_dir() else start_path.parent,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
+        import duckdb
+    except ImportError:
+        print("Error: duckdb not installed. Run: pip install duckdb")
+        sys.exit(1)
+    return duckdb
+
+
+def find_git_root(start_path: Path) -> Path | None:
+    """
+    Find the root of the git repository containing start_path.
+
+    Walks up from start_path the way `git rev-parse --show-toplevel` does,
+    stopping at the first directory with a `.git` repository directory or a
+    `.git` file pointing at one (linked worktrees, submodules). Reads the
+    filesystem directly instead of spawning git.
+    """
+    start = (start_path if start_path.is_dir() else start_path.parent).resolve()
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if (dot_git / "HEAD").is_file():
+            return candidate
+        if dot_git.is_file():
+            try:
+                with open(dot_git) as f:
+                    if f.readline().startswith("gitdir:"):
+                        return candidate
+            except OSError:
+                pass
+    return None
 
 
 def ensure_gitignore_excludes_duckdb(db_path: Path) -> bool:
@@ -94,8 +125,9 @@ def init_database(
     memory_limit: str | None = None,
     threads: int | None = None,
     extensions: list[str] | None = None,
-) -> duckdb.DuckDBPyConnection:
+) -> "duckdb.DuckDBPyConnection":
     """Initialize a DuckDB database with configuration and extensions."""
+    duckdb = require_duckdb()
 
     config = DEFAULT_CONFIG.copy()
     if memory_limit:
@@ -105,15 +137,21 @@ def init_database(
 
     con = duckdb.connect(db_path, config=config)
 
-    # Install and load extensions
+    # Install and load extensions in one multi-statement call; if any of
+    # them fails, retry one by one so each failure is reported by name
     ext_list = extensions or COMMON_EXTENSIONS
-    for ext in ext_list:
-        try:
-            con.execute(f"INSTALL {ext}")
-            con.execute(f"LOAD {ext}")
+    try:
+        con.execute(";\n".join(f"INSTALL {ext}; LOAD {ext}" for ext in ext_list))
+        for ext in ext_list:
             print(f"Loaded extension: {ext}")
-        except Exception as e:
-            print(f"Warning: Could not load {ext}: {e}")
+    except Exception:
+        for ext in ext_list:
+            try:
+                con.execute(f"INSTALL {ext}")
+                con.execute(f"LOAD {ext}")
+                print(f"Loaded extension: {ext}")
+            except Exception as e:
+                print(f"Warning: Could not load {ext}: {e}")
 
     return con
 
@@ -143,6 +181,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Fail on a missing duckdb before touching .gitignore or prompting
+    require_duckdb()
+
     db_path = args.database
     if db_path != ":memory:":
         path = Path(db_path).resolve()
@@ -165,15 +206,19 @@ def main():
         extensions=args.extensions,
     )
 
-    # Print summary
+    # Print summary (settings and loaded extensions fetched in one query)
+    rows = con.execute(SUMMARY_QUERY).fetchall()
+
     print(f"\nDatabase initialized: {db_path}")
     print("\nConfiguration:")
-    for row in con.execute("SELECT name, value FROM duckdb_settings() WHERE name IN ('memory_limit', 'threads', 'temp_directory')").fetchall():
-        print(f"  {row[0]}: {row[1]}")
+    for kind, name, value in rows:
+        if kind == "setting":
+            print(f"  {name}: {value}")
 
     print("\nLoaded extensions:")
-    for row in con.execute("SELECT extension_name FROM duckdb_extensions() WHERE loaded = true").fetchall():
-        print(f"  {row[0]}")
+    for kind, name, _ in rows:
+        if kind == "extension":
+            print(f"  {name}")
 
     con.close()
     print("\nDone.")
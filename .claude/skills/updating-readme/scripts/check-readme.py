@@ -12,11 +12,41 @@ If project_root is not specified, uses current directory.
 """
 
 import json
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
 from typing import Optional
 
+try:
+    import tomllib
+    HAS_TOMLLIB = True
+except ImportError:
+    HAS_TOMLLIB = False
+
+# Environment variable lookups by language, fused into one alternation so
+# each file is scanned once; exactly one group matches per hit. Bytes
+# patterns let source files be scanned without decoding them first.
+ENV_VAR_RE = re.compile(
+    rb'process\.env\.(?P<node>[A-Z_][A-Z0-9_]*)'      # Node.js
+    rb'|os\.environ\[[\'"](?P<py1>[^\r\n]*?)[\'"]\]'  # Python
+    rb'|os\.getenv\([\'"](?P<py2>[^\r\n]*?)[\'"]\)'   # Python
+    rb'|env::var\([\'"](?P<rs>[^\r\n]*?)[\'"]\)'     # Rust
+    rb'|os\.Getenv\([\'"](?P<go>[^\r\n]*?)[\'"]\)'   # Go
+)
+ENV_SCAN_EXTENSIONS = (".py", ".js", ".ts", ".jsx", ".tsx", ".rs", ".go", ".rb")
+ENV_SCAN_SKIP_DIRS = frozenset({"node_modules", "venv", ".venv", "__pycache__", "dist", "build", ".git"})
+# Characters that end the package name in a requirement specifier
+DEP_TERMINATORS = "=<>!~[ ;"
+# Files at least this large are memory-mapped instead of read into memory
+ENV_SCAN_MMAP_MIN_SIZE = 64 * 1024
+
+# Match ## or # headings, one per line
+_HEADING_RE = re.compile(r'^(#{1,3})[^\S\n]+(.+)$', re.MULTILINE)
+# Line boundaries str.splitlines() honours besides \n
+_EXTRA_LINE_BREAK_RE = re.compile(r'[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
 
 def detect_project_type(root: Path) -> str:
     """Detect the primary project type based on config files."""
@@ -30,17 +60,39 @@ def detect_project_type(root: Path) -> str:
         "dotnet": ["*.csproj", "*.sln"],
     }
 
+    # List the root once; broken symlinks don't count as present
+    try:
+        with os.scandir(root) as it:
+            names = {
+                entry.name for entry in it
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except OSError:
+        names = set()
+
     for project_type, files in indicators.items():
         for pattern in files:
             if "*" in pattern:
-                if list(root.glob(pattern)):
+                suffix = pattern[1:]
+                if any(name.endswith(suffix) for name in names):
                     return project_type
-            elif (root / pattern).exists():
+            elif pattern in names:
                 return project_type
 
     return "unknown"
 
 
+def _pkg_name(requirement: str) -> str:
+    """Return the package name from a requirement like 'pkg[extra]>=1.0'."""
+    requirement = requirement.strip()
+    end = len(requirement)
+    for c in DEP_TERMINATORS:
+        i = requirement.find(c, 0, end)
+        if i >= 0:
+            end = i
+    return requirement[:end].rstrip()
+
+
 def extract_dependencies(root: Path) -> dict:
     """Extract dependencies from various package managers."""
     deps = {"runtime": [], "dev": []}
@@ -63,66 +115,72 @@ def extract_dependencies(root: Path) -> dict:
                 line = line.strip()
                 if line and not line.startswith("#"):
                     # Extract package name (before ==, >=, etc.)
-                    pkg = re.split(r"[=<>!\[]", line)[0].strip()
+                    pkg = _pkg_name(line)
                     if pkg:
                         deps["runtime"].append(pkg)
         except IOError:
             pass
 
-    # Python - pyproject.toml (basic parsing)
+    # Python - pyproject.toml
     pyproject = root / "pyproject.toml"
     if pyproject.exists():
         try:
             content = pyproject.read_text()
-            # Simple regex to find dependencies array
-            dep_match = re.search(r'dependencies\s*=\s*\[(.*?)\]', content, re.DOTALL)
-            if dep_match:
-                dep_str = dep_match.group(1)
-                for match in re.finditer(r'"([^"]+)"', dep_str):
-                    pkg = re.split(r"[=<>!\[]", match.group(1))[0].strip()
+            if HAS_TOMLLIB:
+                project = tomllib.loads(content).get("project", {})
+                for dep in project.get("dependencies", []):
+                    pkg = _pkg_name(dep)
                     if pkg:
                         deps["runtime"].append(pkg)
-        except IOError:
+                for group in project.get("optional-dependencies", {}).values():
+                    for dep in group:
+                        pkg = _pkg_name(dep)
+                        if pkg:
+                            deps["dev"].append(pkg)
+            else:
+                # Simple regex to find dependencies array (Python < 3.11)
+                dep_match = re.search(r'dependencies\s*=\s*\[(.*?)\]', content, re.DOTALL)
+                if dep_match:
+                    dep_str = dep_match.group(1)
+                    for match in re.finditer(r'"([^"]+)"', dep_str):
+                        pkg = _pkg_name(match.group(1))
+                        if pkg:
+                            deps["runtime"].append(pkg)
+        except (IOError, ValueError):
             pass
 
     return deps
 
 
+def _env_var_names(data) -> set:
+    """Return the environment variable names referenced in raw file bytes."""
+    # Dedupe the raw captures first so each name is decoded once per file
+    raw = {match.group(match.lastindex) for match in ENV_VAR_RE.finditer(data)}
+    return {name.decode("utf-8", "replace") for name in raw}
+
+
 def extract_env_vars(root: Path) -> set:
     """Find environment variables used in source code."""
     env_vars = set()
 
-    # Patterns for different languages
-    patterns = [
-        r'process\.env\.([A-Z_][A-Z0-9_]*)',  # Node.js
-        r'os\.environ\[[\'"](.*?)[\'"]\]',     # Python
-        r'os\.getenv\([\'"](.*?)[\'"]\)',      # Python
-        r'env::var\([\'"](.*?)[\'"]\)',        # Rust
-        r'os\.Getenv\([\'"](.*?)[\'"]\)',      # Go
-    ]
-
-    # Common source directories
-    source_dirs = ["src", "lib", "app", ".", "scripts"]
-    extensions = [".py", ".js", ".ts", ".jsx", ".tsx", ".rs", ".go", ".rb"]
-
-    for src_dir in source_dirs:
-        dir_path = root / src_dir if src_dir != "." else root
-        if not dir_path.exists():
-            continue
-
-        for ext in extensions:
-            for file_path in dir_path.rglob(f"*{ext}"):
-                # Skip node_modules, venv, etc.
-                if any(skip in str(file_path) for skip in ["node_modules", "venv", ".venv", "__pycache__", "dist", "build"]):
-                    continue
-
-                try:
-                    content = file_path.read_text()
-                    for pattern in patterns:
-                        for match in re.finditer(pattern, content):
-                            env_vars.add(match.group(1))
-                except (IOError, UnicodeDecodeError):
-                    pass
+    # One walk from the root; it already covers src/, lib/, app/ and scripts/
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Skip node_modules, venv, etc. without descending into them
+        dirnames[:] = [d for d in dirnames if d not in ENV_SCAN_SKIP_DIRS]
+
+        for name in filenames:
+            if not name.endswith(ENV_SCAN_EXTENSIONS):
+                continue
+
+            try:
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    if os.fstat(f.fileno()).st_size >= ENV_SCAN_MMAP_MIN_SIZE:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                            env_vars.update(_env_var_names(data))
+                    else:
+                        env_vars.update(_env_var_names(f.read()))
+            except (OSError, ValueError):
+                pass
 
     # Also check .env.example
     env_example = root / ".env.example"
@@ -151,25 +209,23 @@ def parse_readme_sections(readme_path: Path) -> dict:
     except IOError:
         return sections
 
-    current_section = "intro"
-    current_content = []
+    # Headings are found in one pass; section bodies are sliced between them
+    if _EXTRA_LINE_BREAK_RE.search(content):
+        content = "\n".join(content.splitlines()) + "\n"
 
-    for line in content.splitlines():
-        # Match ## or # headings
-        heading_match = re.match(r'^(#{1,3})\s+(.+)$', line)
-        if heading_match:
-            # Save previous section
-            if current_content:
-                sections[current_section.lower()] = "\n".join(current_content).strip()
+    current_section = "intro"
+    start = 0
+    for heading_match in _HEADING_RE.finditer(content):
+        # Save previous section
+        if heading_match.start() > start:
+            sections[current_section.lower()] = content[start:heading_match.start()].strip()
 
-            current_section = heading_match.group(2).strip()
-            current_content = []
-        else:
-            current_content.append(line)
+        current_section = heading_match.group(2).strip()
+        start = heading_match.end() + 1
 
     # Save last section
-    if current_content:
-        sections[current_section.lower()] = "\n".join(current_content).strip()
+    if len(content) > start:
+        sections[current_section.lower()] = content[start:].strip()
 
     return sections
 
@@ -177,29 +233,47 @@ def parse_readme_sections(readme_path: Path) -> dict:
 def check_documented_env_vars(readme_sections: dict, code_env_vars: set) -> list:
     """Check if environment variables from code are documented."""
     missing = []
+    if not code_env_vars:
+        return missing
 
     # Look for env vars in configuration/environment sections
     config_sections = ["configuration", "environment variables", "environment", "config", "setup"]
 
-    readme_text = ""
-    for section_name in config_sections:
-        for key, content in readme_sections.items():
-            if section_name in key.lower():
-                readme_text += content + "\n"
+    # Section keys are already lowercased by parse_readme_sections
+    texts = [
+        content for key, content in readme_sections.items()
+        if any(section_name in key for section_name in config_sections)
+    ]
 
     # Also check the full readme if no specific section found
-    if not readme_text:
-        readme_text = "\n".join(readme_sections.values())
-
-    for var in code_env_vars:
-        if var not in readme_text:
+    if not texts:
+        texts = readme_sections.values()
+
+    # One pass over each section for all names; whole-word matches only, so
+    # PATH is not documented by PATHOLOGY (longest names tried first)
+    names = sorted(code_env_vars, key=len, reverse=True)
+    pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, names)) + r")(?!\w)")
+    found = set()
+    for text in texts:
+        found.update(pattern.findall(text))
+
+    for var in names:
+        if var not in found:
             missing.append(var)
 
     return missing
 
 
-def suggest_updates(root: Path) -> list:
-    """Generate update suggestions by comparing project state to README."""
+def suggest_updates(
+    root: Path,
+    sections: Optional[dict] = None,
+    project_type: Optional[str] = None,
+) -> list:
+    """Generate update suggestions by comparing project state to README.
+
+    Callers that already parsed the README or detected the project type can
+    pass them in to avoid repeating the work.
+    """
     suggestions = []
     readme_path = root / "README.md"
 
@@ -212,8 +286,10 @@ def suggest_updates(root: Path) -> list:
         })
         return suggestions
 
-    sections = parse_readme_sections(readme_path)
-    project_type = detect_project_type(root)
+    if sections is None:
+        sections = parse_readme_sections(readme_path)
+    if project_type is None:
+        project_type = detect_project_type(root)
     deps = extract_dependencies(root)
     env_vars = extract_env_vars(root)
 
@@ -224,7 +300,7 @@ def suggest_updates(root: Path) -> list:
         "prerequisites": "prerequisites",
     }
 
-    section_keys = [k.lower() for k in sections.keys()]
+    section_keys = list(sections)  # already lowercased by parse_readme_sections
 
     for section, name in recommended_sections.items():
         found = any(section in key for key in section_keys)
@@ -250,7 +326,7 @@ def suggest_updates(root: Path) -> list:
 
     # Check if .env.example exists but not documented
     if (root / ".env.example").exists():
-        config_mentioned = any("env" in key.lower() for key in section_keys)
+        config_mentioned = any("env" in key for key in section_keys)
         if not config_mentioned:
             suggestions.append({
                 "type": "missing_reference",
@@ -283,15 +359,17 @@ def main():
         print(f"Error: {root} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    suggestions = suggest_updates(root)
+    project_type = detect_project_type(root)
+    sections = parse_readme_sections(root / "README.md")
+    suggestions = suggest_updates(root, sections=sections, project_type=project_type)
 
     if not suggestions:
         print("README appears to be up to date!")
-        print(f"\nProject type: {detect_project_type(root)}")
+        print(f"\nProject type: {project_type}")
         return
 
     print(f"README Update Suggestions for: {root}")
-    print(f"Project type: {detect_project_type(root)}")
+    print(f"Project type: {project_type}")
     print("=" * 50)
 
     # Group by priority
@@ -12,6 +12,7 @@ Extracts code blocks from markdown and validates syntax:
 Usage:
     python check_code_blocks.py <file.md>
     python check_code_blocks.py --lang python <file.md>
+    python check_code_blocks.py --fail-fast <file.md>
 
 Exit codes:
     0 - All code blocks valid (or no code blocks found)
@@ -24,6 +25,7 @@ import ast
 import json
 import re
 import sys
+from itertools import repeat
 from pathlib import Path
 from typing import NamedTuple
 
@@ -33,6 +35,10 @@ try:
 except ImportError:
     HAS_YAML = False
 
+# Compiled once at import
+_FENCE_LANG_RE = re.compile(r'(\w+)\n')
+_HEREDOC_RE = re.compile(r"<<['\"]?(\w+)['\"]?")
+
 
 class CodeBlock(NamedTuple):
     """Represents an extracted code block."""
@@ -49,21 +55,40 @@ class SyntaxIssue(NamedTuple):
 
 
 def extract_code_blocks(content: str) -> list[CodeBlock]:
-    """Extract all code blocks from markdown content."""
+    """Extract all code blocks from markdown content.
+
+    A block opens with ``` immediately followed by a language hint and a
+    newline, and ends at the next ```. Fences are located with str.find,
+    so an unclosed block costs one scan instead of one per later fence.
+    """
     blocks = []
+    pos = 0
+    line_num, counted_to = 1, 0
+
+    while True:
+        start = content.find('```', pos)
+        if start < 0:
+            break
+
+        # Match fenced code blocks with language hint
+        lang_match = _FENCE_LANG_RE.match(content, start + 3)
+        if not lang_match:
+            pos = start + 1
+            continue
 
-    # Match fenced code blocks with language hint
-    pattern = r'```(\w+)\n(.*?)```'
+        end = content.find('```', lang_match.end())
+        if end < 0:
+            break  # No later fence can close either
 
-    for match in re.finditer(pattern, content, re.DOTALL):
-        lang = match.group(1).lower()
-        code = match.group(2)
+        lang = lang_match.group(1).lower()
+        code = content[lang_match.end():end]
 
-        # Calculate line number
-        start_pos = match.start()
-        line_num = content[:start_pos].count('\n') + 1
+        # Calculate line number, counting only text not seen before
+        line_num += content.count('\n', counted_to, start)
+        counted_to = start
 
         blocks.append(CodeBlock(lang, code, line_num))
+        pos = end + 3
 
     return blocks
 
@@ -100,8 +125,16 @@ def validate_yaml(code: str) -> str | None:
         return str(e)
 
 
-def validate_javascript(code: str) -> str | None:
-    """Basic JavaScript syntax validation (pattern-based)."""
+def _count_unescaped(line: str, quote: str) -> int:
+    """Count occurrences of quote not directly preceded by a backslash."""
+    return line.count(quote) - line.count('\\' + quote)
+
+
+def validate_javascript(code: str, fail_fast: bool = False) -> str | None:
+    """Basic JavaScript syntax validation (pattern-based).
+
+    With fail_fast, stop at the first issue instead of collecting them all.
+    """
     issues = []
 
     # Check for common syntax errors
@@ -112,6 +145,8 @@ def validate_javascript(code: str) -> str | None:
         issues.append("Unmatched square brackets")
     if code.count('(') != code.count(')'):
         issues.append("Unmatched parentheses")
+    if issues and fail_fast:
+        return issues[0]
 
     # Unclosed strings (basic check)
     lines = code.split('\n')
@@ -121,8 +156,8 @@ def validate_javascript(code: str) -> str | None:
             continue
 
         # Count unescaped quotes
-        single_quotes = len(re.findall(r"(?<!\\)'", line))
-        double_quotes = len(re.findall(r'(?<!\\)"', line))
+        single_quotes = _count_unescaped(line, "'")
+        double_quotes = _count_unescaped(line, '"')
         backticks = line.count('`')
 
         # Template literals can span lines, so only check regular quotes
@@ -130,12 +165,17 @@ def validate_javascript(code: str) -> str | None:
             issues.append(f"Line {i}: Unclosed single quote")
         if double_quotes % 2 != 0:
             issues.append(f"Line {i}: Unclosed double quote")
+        if issues and fail_fast:
+            return issues[0]
 
     return '; '.join(issues) if issues else None
 
 
-def validate_bash(code: str) -> str | None:
-    """Basic bash syntax validation (pattern-based)."""
+def validate_bash(code: str, fail_fast: bool = False) -> str | None:
+    """Basic bash syntax validation (pattern-based).
+
+    With fail_fast, stop at the first issue instead of collecting them all.
+    """
     issues = []
 
     lines = code.split('\n')
@@ -147,7 +187,7 @@ def validate_bash(code: str) -> str | None:
 
         # Track heredocs
         if '<<' in stripped and not in_heredoc:
-            match = re.search(r"<<['\"]?(\w+)['\"]?", stripped)
+            match = _HEREDOC_RE.search(stripped)
             if match:
                 in_heredoc = True
                 heredoc_marker = match.group(1)
@@ -173,14 +213,20 @@ def validate_bash(code: str) -> str | None:
             if not any(p in stripped for p in ['$(', '`']):
                 issues.append(f"Line {i}: Possibly unclosed single quote")
 
+        if issues and fail_fast:
+            return issues[0]
+
     if in_heredoc:
         issues.append(f"Unclosed heredoc (expecting {heredoc_marker})")
 
     return '; '.join(issues) if issues else None
 
 
-def validate_code_block(block: CodeBlock) -> SyntaxIssue | None:
-    """Validate a single code block based on its language."""
+def validate_code_block(block: CodeBlock, fail_fast: bool = False) -> SyntaxIssue | None:
+    """Validate a single code block based on its language.
+
+    With fail_fast, pattern-based validators report only the first issue.
+    """
     validators = {
         'python': validate_python,
         'py': validate_python,
@@ -200,15 +246,31 @@ def validate_code_block(block: CodeBlock) -> SyntaxIssue | None:
     if not validator:
         return None  # No validator for this language
 
-    error = validator(block.content)
+    if validator in (validate_javascript, validate_bash):
+        error = validator(block.content, fail_fast)
+    else:
+        error = validator(block.content)
     if error:
         return SyntaxIssue(block.language, block.line_number, error)
 
     return None
 
 
-def validate_file(filepath: str, lang_filter: str = None) -> list[SyntaxIssue]:
-    """Validate all code blocks in a file."""
+# Blocks in one file before validating them in worker processes pays off
+PARALLEL_MIN_BLOCKS = 256
+
+
+def validate_file(
+    filepath: str,
+    lang_filter: str = None,
+    fail_fast: bool = False,
+    jobs: int | None = None,
+) -> list[SyntaxIssue]:
+    """Validate all code blocks in a file.
+
+    Files with many blocks are validated across `jobs` worker processes
+    (None = CPU count, 1 = always serial).
+    """
     try:
         content = Path(filepath).read_text()
     except FileNotFoundError:
@@ -220,13 +282,33 @@ def validate_file(filepath: str, lang_filter: str = None) -> list[SyntaxIssue]:
     if lang_filter:
         blocks = [b for b in blocks if b.language == lang_filter.lower()]
 
-    issues = []
-    for block in blocks:
-        issue = validate_code_block(block)
-        if issue:
-            issues.append(issue)
+    results = None
+    if jobs != 1 and len(blocks) >= PARALLEL_MIN_BLOCKS:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
 
-    return issues
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(
+                    validate_code_block, blocks, repeat(fail_fast), chunksize=32
+                ))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No usable pool; validated serially below
+    if results is None:
+        results = [validate_code_block(block, fail_fast) for block in blocks]
+
+    return [issue for issue in results if issue]
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for --jobs: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -237,6 +319,10 @@ def main():
     parser.add_argument('--lang', help='Only check blocks of this language')
     parser.add_argument('--list', action='store_true',
         help='List code blocks without validating')
+    parser.add_argument('--fail-fast', action='store_true',
+        help='Report only the first issue in each code block')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=None,
+        help='Worker processes for files with many code blocks (default: CPU count; 1 = serial)')
     args = parser.parse_args()
 
     content = Path(args.file).read_text()
@@ -251,7 +337,7 @@ def main():
             print(f"  Line {block.line_number}: {block.language} - {preview}")
         return
 
-    issues = validate_file(args.file, args.lang)
+    issues = validate_file(args.file, args.lang, args.fail_fast, args.jobs)
 
     if not issues:
         print(f"✓ All code blocks valid ({len(blocks)} checked)")
@@ -12,6 +12,7 @@ Checks documentation files for common quality issues:
 Usage:
     python validate_docs.py <file.md>
     python validate_docs.py <directory>
+    python validate_docs.py --cache <directory>
     python validate_docs.py --help
 
 Exit codes:
@@ -21,12 +22,47 @@ Exit codes:
 """
 
 import argparse
+import json
+import os
 import re
 import sys
 from pathlib import Path
 from typing import NamedTuple
 
 
+_PLACEHOLDERS = [
+    (r'\[TODO\]', 'Contains [TODO] placeholder'),
+    (r'\[PLACEHOLDER\]', 'Contains [PLACEHOLDER] text'),
+    (r'\[INSERT.*?\]', 'Contains [INSERT...] placeholder'),
+    (r'\[YOUR.*?\]', 'Contains [YOUR...] placeholder'),
+    (r'<.*?TODO.*?>', 'Contains <TODO> placeholder'),
+    (r'xxx+', 'Contains xxx placeholder'),
+    (r'TBD', 'Contains TBD (to be determined)'),
+]
+
+# Placeholder patterns, each with a variant that matches the placeholder
+# inside backticks (inline code or documenting placeholders)
+_PLACEHOLDER_PATTERNS = [
+    (
+        re.compile(pattern, re.IGNORECASE),
+        re.compile(r'`[^`]*' + pattern + r'[^`]*`', re.IGNORECASE),
+        message,
+    )
+    for pattern, message in _PLACEHOLDERS
+]
+
+# Any placeholder at all; lets placeholder-free lines through in one scan
+_ANY_PLACEHOLDER_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern, _ in _PLACEHOLDERS), re.IGNORECASE
+)
+
+# Language hint (possibly empty) and newline after an opening ``` fence
+_FENCE_LANG_RE = re.compile(r'(\w*)\n')
+
+# Match markdown links: [text](url)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
 class Issue(NamedTuple):
     """Represents a validation issue."""
     file: str
@@ -35,25 +71,27 @@ class Issue(NamedTuple):
     message: str
 
 
-def check_placeholder_text(content: str, filepath: str) -> list[Issue]:
+def check_placeholder_text(content: str, filepath: str, lines: list[str] | None = None) -> list[Issue]:
     """Check for placeholder text that should be replaced."""
     issues = []
-    patterns = [
-        (r'\[TODO\]', 'Contains [TODO] placeholder'),
-        (r'\[PLACEHOLDER\]', 'Contains [PLACEHOLDER] text'),
-        (r'\[INSERT.*?\]', 'Contains [INSERT...] placeholder'),
-        (r'\[YOUR.*?\]', 'Contains [YOUR...] placeholder'),
-        (r'<.*?TODO.*?>', 'Contains <TODO> placeholder'),
-        (r'xxx+', 'Contains xxx placeholder'),
-        (r'TBD', 'Contains TBD (to be determined)'),
-    ]
-
-    for line_num, line in enumerate(content.split('\n'), 1):
-        for pattern, message in patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+    if lines is None:
+        lines = content.split('\n')
+
+    for line_num, line in enumerate(lines, 1):
+        # Every placeholder needs a bracket, an angle bracket, "xxx" or "tbd";
+        # plain substring tests rule out most lines before any regex runs
+        if '[' not in line and '<' not in line:
+            lowered = line.lower()
+            if 'xxx' not in lowered and 'tbd' not in lowered:
+                continue
+        if not _ANY_PLACEHOLDER_RE.search(line):
+            continue
+
+        for pattern, quoted_pattern, message in _PLACEHOLDER_PATTERNS:
+            if pattern.search(line):
                 # Skip if the match is inside backticks (inline code or documenting placeholders)
                 # Check for `...pattern...` or documenting the pattern itself
-                if re.search(r'`[^`]*' + pattern + r'[^`]*`', line, re.IGNORECASE):
+                if quoted_pattern.search(line):
                     continue
                 issues.append(Issue(filepath, line_num, 'error', message))
 
@@ -63,17 +101,31 @@ def check_placeholder_text(content: str, filepath: str) -> list[Issue]:
 def check_empty_code_blocks(content: str, filepath: str) -> list[Issue]:
     """Check for empty or near-empty code blocks."""
     issues = []
+    line_num, counted_to = 1, 0
+    pos = 0
+
+    while True:
+        start_pos = content.find('```', pos)
+        if start_pos < 0:
+            break
 
-    # Match code blocks with optional language hint
-    code_block_pattern = r'```(\w*)\n(.*?)```'
+        # Opening fence: optional language hint, then a newline
+        lang_match = _FENCE_LANG_RE.match(content, start_pos + 3)
+        if not lang_match:
+            pos = start_pos + 1
+            continue
 
-    for match in re.finditer(code_block_pattern, content, re.DOTALL):
-        lang = match.group(1)
-        block_content = match.group(2).strip()
+        end_pos = content.find('```', lang_match.end())
+        if end_pos < 0:
+            break  # No later fence can close either
+        pos = end_pos + 3
 
-        # Find line number
-        start_pos = match.start()
-        line_num = content[:start_pos].count('\n') + 1
+        lang = lang_match.group(1)
+        block_content = content[lang_match.end():end_pos].strip()
+
+        # Find line number, counting only text not seen before
+        line_num += content.count('\n', counted_to, start_pos)
+        counted_to = start_pos
 
         if not block_content:
             issues.append(Issue(filepath, line_num, 'error',
@@ -85,44 +137,83 @@ def check_empty_code_blocks(content: str, filepath: str) -> list[Issue]:
     return issues
 
 
-def check_broken_links(content: str, filepath: str) -> list[Issue]:
-    """Check for potentially broken internal links."""
-    issues = []
-    base_dir = Path(filepath).parent
-
-    # Match markdown links: [text](url)
-    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+def _internal_links(lines: list[str]) -> list[tuple[int, str]]:
+    """Find (line number, url) for every link that points inside the repo."""
+    links = []
+    for line_num, line in enumerate(lines, 1):
+        if '](' not in line:
+            continue  # No link can start here; skip the regex
 
-    for line_num, line in enumerate(content.split('\n'), 1):
-        for match in re.finditer(link_pattern, line):
-            link_text = match.group(1)
+        for match in _LINK_RE.finditer(line):
             link_url = match.group(2)
 
             # Skip external links and anchors
             if link_url.startswith(('http://', 'https://', '#', 'mailto:')):
                 continue
+            links.append((line_num, link_url))
 
-            # Check if internal file exists
-            link_path = base_dir / link_url.split('#')[0]  # Remove anchor
-            if not link_path.exists():
-                issues.append(Issue(filepath, line_num, 'warning',
-                    f'Broken link to: {link_url}'))
+    return links
+
+
+def _link_issues(
+    filepath: str,
+    links: list[tuple[int, str]],
+    exists_cache: dict[str, bool] | None = None,
+) -> list[Issue]:
+    """Report links from _internal_links() whose target doesn't exist."""
+    issues = []
+    if exists_cache is None:
+        exists_cache = {}
+    base_dir = Path(filepath).parent
+
+    for line_num, link_url in links:
+        # Check if internal file exists
+        link_path = str(base_dir / link_url.split('#')[0])  # Remove anchor
+        exists = exists_cache.get(link_path)
+        if exists is None:
+            exists = exists_cache[link_path] = os.path.exists(link_path)
+        if not exists:
+            issues.append(Issue(filepath, line_num, 'warning',
+                f'Broken link to: {link_url}'))
 
     return issues
 
 
+def check_broken_links(
+    content: str,
+    filepath: str,
+    lines: list[str] | None = None,
+    exists_cache: dict[str, bool] | None = None,
+) -> list[Issue]:
+    """Check for potentially broken internal links.
+
+    Pass the same exists_cache dict across files to check each distinct
+    link target only once.
+    """
+    if lines is None:
+        lines = content.split('\n')
+    return _link_issues(filepath, _internal_links(lines), exists_cache)
+
+
 def check_required_sections(content: str, filepath: str, doc_type: str = None) -> list[Issue]:
     """Check for required sections based on document type."""
     issues = []
+    content_lower = None  # Lowercase copy, made only once a test needs it
 
-    # Detect document type from content if not specified
+    # Detect document type from content if not specified; case-sensitive
+    # tests go first so the lowercase copy can often be skipped
     if doc_type is None:
-        if 'API' in content and ('endpoint' in content.lower() or 'GET ' in content or 'POST ' in content):
+        has_api = 'API' in content
+        if has_api and ('GET ' in content or 'POST ' in content):
             doc_type = 'api'
-        elif 'installation' in content.lower() and 'usage' in content.lower():
-            doc_type = 'guide'
-        elif 'architecture' in content.lower() or 'ADR' in content:
-            doc_type = 'architecture'
+        else:
+            content_lower = content.lower()
+            if has_api and 'endpoint' in content_lower:
+                doc_type = 'api'
+            elif 'installation' in content_lower and 'usage' in content_lower:
+                doc_type = 'guide'
+            elif 'ADR' in content or 'architecture' in content_lower:
+                doc_type = 'architecture'
 
     required_sections = {
         'api': ['Authentication', 'Endpoint', 'Error'],
@@ -130,71 +221,246 @@ def check_required_sections(content: str, filepath: str, doc_type: str = None) -
         'architecture': ['Overview', 'Component'],
     }
 
-    if doc_type and doc_type in required_sections:
-        for section in required_sections[doc_type]:
-            if section.lower() not in content.lower():
-                issues.append(Issue(filepath, 0, 'warning',
-                    f'Missing recommended section: {section}'))
+    if not doc_type or doc_type not in required_sections:
+        return issues  # No known document type; nothing to require
+
+    if content_lower is None:
+        content_lower = content.lower()
+    for section in required_sections[doc_type]:
+        if section.lower() not in content_lower:
+            issues.append(Issue(filepath, 0, 'warning',
+                f'Missing recommended section: {section}'))
 
     return issues
 
 
-def check_code_block_languages(content: str, filepath: str) -> list[Issue]:
+def check_code_block_languages(content: str, filepath: str, lines: list[str] | None = None) -> list[Issue]:
     """Check that code blocks have language hints."""
     issues = []
+    if lines is None:
+        lines = content.split('\n')
 
-    # Match code blocks without language hints
-    pattern = r'```\n'
-
-    for line_num, line in enumerate(content.split('\n'), 1):
-        if line.strip() == '```' and line_num > 1:
+    fences_seen = 0  # Fence lines before the current one
+    for line_num, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped == '```' and line_num > 1:
             # Check if this is an opening fence (not closing)
-            prev_lines = content.split('\n')[:line_num-1]
-            open_fences = sum(1 for l in prev_lines if l.strip().startswith('```'))
-            if open_fences % 2 == 0:  # Even means this is an opening fence
+            if fences_seen % 2 == 0:  # Even means this is an opening fence
                 issues.append(Issue(filepath, line_num, 'warning',
                     'Code block missing language hint'))
+        if stripped.startswith('```'):
+            fences_seen += 1
 
     return issues
 
 
-def validate_file(filepath: str) -> list[Issue]:
-    """Run all validation checks on a file."""
+def _scan_file(filepath: str) -> tuple[list[Issue], list[tuple[int, str]], list[Issue], bool]:
+    """
+    Read a file and run every check except link-target existence.
+
+    Returns:
+        (issues before the link check, internal links, issues after it,
+        whether the result depends only on the file's content)
+    """
     try:
-        content = Path(filepath).read_text()
+        # Decode in one step rather than through the text IO stack
+        content = Path(filepath).read_bytes().decode('utf-8')
     except FileNotFoundError:
-        return [Issue(filepath, 0, 'error', 'File not found')]
+        return [Issue(filepath, 0, 'error', 'File not found')], [], [], False
     except Exception as e:
-        return [Issue(filepath, 0, 'error', f'Error reading file: {e}')]
+        return [Issue(filepath, 0, 'error', f'Error reading file: {e}')], [], [], False
+
+    # Universal newlines, as text mode would have applied
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Split once for the line-oriented checks
+    lines = content.split('\n')
+
+    head = check_placeholder_text(content, filepath, lines)
+    head.extend(check_empty_code_blocks(content, filepath))
+    tail = check_required_sections(content, filepath)
+    tail.extend(check_code_block_languages(content, filepath, lines))
+
+    return head, _internal_links(lines), tail, True
+
+
+def validate_file(filepath: str, exists_cache: dict[str, bool] | None = None) -> list[Issue]:
+    """Run all validation checks on a file.
+
+    exists_cache is shared with check_broken_links; see there.
+    """
+    head, links, tail, _ = _scan_file(filepath)
+    return head + _link_issues(filepath, links, exists_cache) + tail
+
+
+# Files in a directory run before scanning them in worker processes pays off
+PARALLEL_MIN_FILES = 256
+
+
+def _scan_many(files: list[str], jobs: int | None = None) -> list[tuple]:
+    """_scan_file() each file, across worker processes for large batches."""
+    if jobs != 1 and len(files) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(_scan_file, files, chunksize=16))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No usable pool; scan the files here instead
+    return [_scan_file(filepath) for filepath in files]
+
+
+def _iter_markdown_files(dirpath: str):
+    """
+    Yield paths of *.md entries under dirpath, as Path(dirpath).rglob('*.md') would.
+
+    Same order (each directory's matches before its subdirectories, in
+    scandir order) and same path strings, but each directory is listed once
+    and no Path objects are built. Symlinked directories are not followed.
+    """
+    root = str(Path(dirpath))
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            path = entry.name if current == '.' else os.path.join(current, entry.name)
+            if entry.name.endswith('.md'):
+                yield path
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(path)
+            except OSError:
+                pass
+        stack.extend(reversed(subdirs))
+
+
+def validate_directory(
+    dirpath: str,
+    jobs: int | None = None,
+    cache: dict[str, list] | None = None,
+) -> list[Issue]:
+    """Validate all markdown files in a directory.
+
+    Large trees are scanned across `jobs` worker processes
+    (None = CPU count, 1 = always serial). With a cache from load_cache()
+    (updated in place), unchanged files reuse their stored results; their
+    links are still checked against the current tree.
+    """
+    files = list(_iter_markdown_files(dirpath))
+
+    scanned = {}
+    stamps: dict[str, list[int]] = {}
+    stale = files
+    if cache is not None:
+        stale = []
+        for filepath in files:
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                stale.append(filepath)
+                continue
+            stamp = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(os.path.abspath(filepath))
+            if entry and entry[:2] == stamp:
+                head, links, tail = entry[2:]
+                scanned[filepath] = (
+                    [Issue(filepath, *issue) for issue in head],
+                    links,
+                    [Issue(filepath, *issue) for issue in tail],
+                    True,
+                )
+            else:
+                stamps[filepath] = stamp
+                stale.append(filepath)
+
+    for filepath, result in zip(stale, _scan_many(stale, jobs)):
+        scanned[filepath] = result
+        head, links, tail, cacheable = result
+        if cacheable and filepath in stamps:
+            cache[os.path.abspath(filepath)] = stamps[filepath] + [
+                [issue[1:] for issue in head], links, [issue[1:] for issue in tail],
+            ]
 
     issues = []
-    issues.extend(check_placeholder_text(content, filepath))
-    issues.extend(check_empty_code_blocks(content, filepath))
-    issues.extend(check_broken_links(content, filepath))
-    issues.extend(check_required_sections(content, filepath))
-    issues.extend(check_code_block_languages(content, filepath))
+    exists_cache = {}  # Link targets shared across files, checked once per run
+
+    for filepath in files:
+        head, links, tail, _ = scanned[filepath]
+        issues.extend(head)
+        issues.extend(_link_issues(filepath, links, exists_cache))
+        issues.extend(tail)
 
     return issues
 
 
-def validate_directory(dirpath: str) -> list[Issue]:
-    """Validate all markdown files in a directory."""
-    issues = []
+def _cache_file() -> Path | None:
+    """Where --cache results live; None if there is no cache directory."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        try:
+            base = Path.home() / '.cache'
+        except RuntimeError:
+            return None  # No HOME and no passwd entry
+    return Path(base) / 'promptkit' / 'validate_docs.json'
 
-    for md_file in Path(dirpath).rglob('*.md'):
-        issues.extend(validate_file(str(md_file)))
 
-    return issues
+def _cache_version() -> str:
+    return f'1:{Path(__file__).stat().st_mtime_ns}'  # Edits to this script invalidate
+
+
+def load_cache(path: Path | None = None) -> dict[str, list]:
+    """Load {abspath: [mtime_ns, size, head, links, tail]}; empty if stale or missing."""
+    path = path or _cache_file()
+    try:
+        data = json.loads(path.read_text()) if path else None
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get('version') != _cache_version():
+        return {}
+    return data.get('files', {})
+
+
+def save_cache(cache: dict[str, list], path: Path | None = None) -> None:
+    """Write the cache atomically; failures only produce a warning."""
+    path = path or _cache_file()
+    try:
+        if path is None:
+            raise OSError('no cache directory; set XDG_CACHE_HOME')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'version': _cache_version(), 'files': cache}, separators=(',', ':')))
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"Warning: Could not write cache ({e})", file=sys.stderr)
 
 
 def format_issues(issues: list[Issue]) -> str:
     """Format issues for display."""
+    return _format_issues(issues)[0]
+
+
+def _format_issues(issues: list[Issue]) -> tuple[str, list[Issue], list[Issue]]:
+    """format_issues(), plus the errors and warnings it split out along the way."""
+    errors, warnings = [], []
+    for issue in issues:  # One pass instead of a filter per severity
+        if issue.severity == 'error':
+            errors.append(issue)
+        elif issue.severity == 'warning':
+            warnings.append(issue)
+
     if not issues:
-        return "✓ All checks passed"
+        return "✓ All checks passed", errors, warnings
 
     output = []
-    errors = [i for i in issues if i.severity == 'error']
-    warnings = [i for i in issues if i.severity == 'warning']
 
     if errors:
         output.append(f"\n✗ {len(errors)} error(s):")
@@ -208,7 +474,18 @@ def format_issues(issues: list[Issue]) -> str:
             loc = f"{issue.file}:{issue.line}" if issue.line else issue.file
             output.append(f"  WARN  {loc}: {issue.message}")
 
-    return '\n'.join(output)
+    return '\n'.join(output), errors, warnings
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for --jobs: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -218,6 +495,10 @@ def main():
     parser.add_argument('path', help='File or directory to validate')
     parser.add_argument('--strict', action='store_true',
         help='Treat warnings as errors')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=None,
+        help='Worker processes for large directories (default: CPU count; 1 = serial)')
+    parser.add_argument('--cache', action='store_true',
+        help='Reuse results for unchanged files in a directory across runs')
     args = parser.parse_args()
 
     path = Path(args.path)
@@ -227,14 +508,15 @@ def main():
         sys.exit(2)
 
     if path.is_dir():
-        issues = validate_directory(args.path)
+        cache = load_cache() if args.cache else None
+        issues = validate_directory(args.path, args.jobs, cache)
+        if cache is not None:
+            save_cache(cache)
     else:
         issues = validate_file(args.path)
 
-    print(format_issues(issues))
-
-    errors = [i for i in issues if i.severity == 'error']
-    warnings = [i for i in issues if i.severity == 'warning']
+    report, errors, warnings = _format_issues(issues)
+    print(report)
 
     if errors or (args.strict and warnings):
         sys.exit(1)
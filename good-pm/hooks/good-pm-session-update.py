@@ -15,10 +15,17 @@ Exit codes:
 """
 
 import json
-import re
+import locale
+import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def check_pm_work_detected(session_path: Path) -> bool:
     """Check SESSION.md frontmatter for pm_work_detected flag (D4: assumes frontmatter exists)."""
@@ -26,11 +33,12 @@ def check_pm_work_detected(session_path: Path) -> bool:
         return False
 
     content = session_path.read_text()
-    frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not frontmatter_match:
+    # Frontmatter runs from an opening "---" line to the next "\n---"
+    end = content.find('\n---', 4) if content.startswith('---\n') else -1
+    if end < 0:
         return False  # No frontmatter = no PM work
 
-    frontmatter = frontmatter_match.group(1)
+    frontmatter = content[4:end]
     return 'pm_work_detected: true' in frontmatter
 
 
@@ -44,27 +52,95 @@ def reset_pm_work_detected(session_path: Path) -> None:
     session_path.write_text(updated)
 
 
+def _parse_line(line):
+    """Parse one JSONL line, with orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN, huge ints, etc.; let it decide
+    return json.loads(line)
+
+
+# Keywords that indicate session context was just updated
+UPDATE_INDICATORS = [
+    "session context updated",
+    "updated session",
+    "notes for next session",
+    "session handoff",
+    "updated .good-pm/session",
+    "no updates needed",
+    "no changes needed",
+]
+
+
+def _transcript_entry(line):
+    """Return the conversation message on one stripped JSONL line, or None."""
+    try:
+        entry = _parse_line(line)
+    except json.JSONDecodeError:
+        return None
+    # Extract message if it's a conversation entry
+    if "type" in entry and entry["type"] in ("user", "assistant"):
+        return {
+            "role": entry["type"],
+            "content": entry.get("message", {}).get("content", "")
+        }
+    return None
+
+
 def load_transcript(transcript_path):
-    """Load transcript from JSONL file."""
-    transcript = []
+    """Lazily load transcript messages from a JSONL file.
+
+    Nothing is read until the result is iterated.
+    """
     try:
         with open(transcript_path, "r") as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    try:
-                        entry = json.loads(line)
-                        # Extract message if it's a conversation entry
-                        if "type" in entry and entry["type"] in ("user", "assistant"):
-                            transcript.append({
-                                "role": entry["type"],
-                                "content": entry.get("message", {}).get("content", "")
-                            })
-                    except json.JSONDecodeError:
-                        continue
+                    msg = _transcript_entry(line)
+                    if msg is not None:
+                        yield msg
+    except (IOError, OSError):
+        pass
+
+
+def load_transcript_reversed(transcript_path, block_size=8192):
+    """Lazily load transcript messages from a JSONL file, last message first.
+
+    The file is read backward in blocks, so finding a recent message
+    costs a tail read instead of a full parse. Lines are split and decoded
+    as load_transcript's text-mode read would.
+    """
+    encoding = locale.getpreferredencoding(False)
+    try:
+        with open(transcript_path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            # Blocks read since the last newline, latest first; joined only
+            # once a newline turns up, so a long line is copied just once
+            pending = []
+            while pos > 0:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                pending.append(block)
+                if pos > 0 and block.rfind(b"\n") < 0:
+                    continue  # Still inside one line; keep reading back
+                pieces = b"".join(reversed(pending)).split(b"\n")
+                # The first piece may be the tail end of an earlier line
+                pending = [pieces.pop(0)] if pos > 0 else []
+                for raw in reversed(pieces):
+                    # Text mode also treats a lone \r as a line break
+                    for line in reversed(raw.decode(encoding).replace("\r", "\n").split("\n")):
+                        line = line.strip()
+                        if line:
+                            msg = _transcript_entry(line)
+                            if msg is not None:
+                                yield msg
     except (IOError, OSError):
         pass
-    return transcript
 
 
 def main():
@@ -114,29 +190,58 @@ def main():
         print(json.dumps({"decision": "approve"}))
         return 0
 
+    # An update phrase in the last assistant message settles it, whatever
+    # came before; on a transcript file this needs only a tail read
+    if transcript_path:
+        recent = load_transcript_reversed(transcript_path)
+    else:
+        recent = reversed(transcript)
+    last_assistant_msg = None
+    for msg in recent:
+        if msg.get("role") == "assistant":
+            content = msg.get("content", "")
+            if isinstance(content, list):
+                content = " ".join(
+                    block.get("text", "")
+                    for block in content
+                    if block.get("type") == "text"
+                )
+            last_assistant_msg = content
+            break
+
+    if last_assistant_msg and isinstance(last_assistant_msg, str):
+        lower_msg = last_assistant_msg.lower()
+        if any(indicator in lower_msg for indicator in UPDATE_INDICATORS):
+            # Session was updated, reset flag and approve
+            reset_pm_work_detected(session_file)
+            print(json.dumps({"decision": "approve"}))
+            return 0
+
     # Check if any meaningful PM work was done in this conversation
     # Only block if there were tool calls or PM-related activity
     has_tool_usage = False
     has_pm_activity = False
-    last_assistant_msg = None
 
+    # "good-pm", "spec" and "issue" also cover ".good-pm", "create-spec"
+    # and "create-issues", so those are not listed separately
     pm_keywords = [
-        "good-pm", ".good-pm", "spec", "issue", "create-spec",
-        "create-issues", "implementation", "acceptance criteria"
+        "good-pm", "spec", "issue", "implementation", "acceptance criteria"
     ]
 
     for msg in transcript:
         content = msg.get("content", "")
 
         # Check for tool_use blocks (indicates actual work was done)
-        if isinstance(content, list):
+        if isinstance(content, list) and not has_tool_usage:
             for block in content:
                 if block.get("type") == "tool_use":
                     has_tool_usage = True
                     break
 
         # Check for PM-related keywords in messages
-        if isinstance(content, str):
+        if has_pm_activity:
+            pass
+        elif isinstance(content, str):
             lower_content = content.lower()
             if any(kw in lower_content for kw in pm_keywords):
                 has_pm_activity = True
@@ -150,6 +255,10 @@ def main():
             if any(kw in lower_content for kw in pm_keywords):
                 has_pm_activity = True
 
+        # Both answers are known; the rest of the transcript can't change them
+        if has_tool_usage and has_pm_activity:
+            break
+
     # If no tools used and no PM activity, this is a casual conversation - don't block
     # Reset flag (self-healing for stale pm_work_detected: true)
     if not has_tool_usage and not has_pm_activity:
@@ -157,38 +266,6 @@ def main():
         print(json.dumps({"decision": "approve"}))
         return 0
 
-    # Get last assistant message for session update check
-    for msg in reversed(transcript):
-        if msg.get("role") == "assistant":
-            content = msg.get("content", "")
-            if isinstance(content, list):
-                content = " ".join(
-                    block.get("text", "")
-                    for block in content
-                    if block.get("type") == "text"
-                )
-            last_assistant_msg = content
-            break
-
-    # Keywords that indicate session context was just updated
-    update_indicators = [
-        "session context updated",
-        "updated session",
-        "notes for next session",
-        "session handoff",
-        "updated .good-pm/session",
-        "no updates needed",
-        "no changes needed",
-    ]
-
-    if last_assistant_msg:
-        lower_msg = last_assistant_msg.lower()
-        if any(indicator in lower_msg for indicator in update_indicators):
-            # Session was updated, reset flag and approve
-            reset_pm_work_detected(session_file)
-            print(json.dumps({"decision": "approve"}))
-            return 0
-
     # Block and request session context review
     # Keep reason concise - detailed instructions are in PM_CONTRACT.md (injected via UserPromptSubmit)
     reason = "Review session context before ending. Check `.good-pm/session/current.md` and apply the Future Self test. Say 'no updates needed' or update the file, then complete your response."